@@ -1,7 +1,63 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
 import argparse
-from typing import List, Optional, Dict, Union
+from typing import List, Optional, Dict, Mapping, Sequence, Tuple, Union
+
+# Tree drawing connectors
+_LAST_CONNECTOR = "└── "
+_MID_CONNECTOR = "├── "
+
+# Banner framing the printed project structure
+_BANNER = "=" * 50
+_HEADER = f"\n✅️ Created ML project successfully\n\n📁 Project Structure:\n{_BANNER}\n"
+_FOOTER = f"\n{_BANNER}\n"
+
+# Default subfolder structure (with subdirectories), shared read-only
+_DEFAULT_STRUCTURE: Mapping[str, Sequence[str]] = MappingProxyType({
+    "data": (),
+    "models": ("checkpoints",),
+    "utils": (),
+    "logs": (),
+    "configs": (),
+    "notebooks": ()
+})
+
+# Default structure flattened to relative paths, parents before children,
+# so every directory is created with a single mkdir
+_DEFAULT_DIRS: Tuple[str, ...] = tuple(
+    path
+    for folder_name, sub_folders in _DEFAULT_STRUCTURE.items()
+    for path in (folder_name, *(os.path.join(folder_name, sub_folder) for sub_folder in sub_folders))
+)
+
+# Worker threads for opt-in parallel directory creation (network filesystems)
+_MKDIR_WORKERS = 8
+
+
+def _raise_error(error: OSError) -> None:
+    """os.walk error handler that propagates scandir failures"""
+    raise error
+
+
+def _make_dir(path: str) -> None:
+    """Create a directory and any missing parents, ignoring an existing directory"""
+    # Optimistic mkdir: no stat() up front, fall back to makedirs for missing parents.
+    # Only on EEXIST is the path checked, so a clashing file still raises.
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        try:
+            os.makedirs(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
 
 class MLProjectCreator:
     """Machine Learning Project Structure Generator"""
@@ -15,103 +71,163 @@ class MLProjectCreator:
                 - List[str]: Simple folder list
                 - Dict: Nested folder structure with subdirectories
         """
-        # Default subfolder structure (with subdirectories)
-        default_structure: Dict[str, List[str]] = {
-            "data": [],
-            "models": ["checkpoints"],
-            "utils": [],
-            "logs": [],
-            "configs": [],
-            "notebooks": []
-        }
-        
+        is_list = isinstance(folders, list)
+        # Built-in layouts use shared/immutable values until `structure` is accessed
+        self._structure_is_internal: bool = folders is None or is_list
         if folders is None:
-            self.structure = default_structure
-        elif isinstance(folders, list):
+            self._structure = _DEFAULT_STRUCTURE
+        elif is_list:
             # If list is passed, convert to simple dictionary structure
-            self.structure = {folder: [] for folder in folders}
+            self._structure = dict.fromkeys(folders, ())
         else:
-            self.structure = folders
+            self._structure = folders
+    
+    @property
+    def structure(self) -> Dict[str, List[str]]:
+        """
+        Folder structure configuration, folder name -> list of subfolder names
+        
+        Reading it copies a built-in layout into a mutable dict of lists, which also
+        moves a default instance off the precomputed _DEFAULT_DIRS creation path.
+        """
+        if self._structure_is_internal:
+            # Copy on first access so callers get a mutable dict of lists
+            self._structure = {name: list(sub_folders) for name, sub_folders in self._structure.items()}
+            self._structure_is_internal = False
+        return self._structure
+    
+    @structure.setter
+    def structure(self, value: Dict[str, List[str]]) -> None:
+        self._structure = value
+        self._structure_is_internal = False
     
-    def _create_directory_recursive(self, base_path: Path, structure: Dict[str, List[str]]) -> None:
+    def _create_directory_recursive(self, base_path: Union[str, Path], structure: Mapping[str, Sequence[str]], parallel: bool = False) -> None:
         """
         Recursively create directory structure
         
         Args:
-            base_path (Path): Base path
-            structure (Dict): Directory structure dictionary
+            base_path (Union[str, Path]): Base path
+            structure (Mapping): Directory structure, folder name -> subfolder names
+            parallel (bool): Create leaf directories on a thread pool
         """
+        base_dir: str = str(base_path)
+        
+        # Collect leaf paths; makedirs creates parent folders of subdirectories
+        leaf_paths: List[str] = []
         for folder_name, sub_folders in structure.items():
-            folder_path: Path = base_path / folder_name
-            folder_path.mkdir(exist_ok=True)
-            # print(f"Created directory: {folder_path.relative_to(Path.cwd())}")
-            
-            # Create subdirectories
-            for sub_folder in sub_folders:
-                sub_path: Path = folder_path / sub_folder
-                sub_path.mkdir(exist_ok=True)
-                # print(f"  Created subdirectory: {sub_path.relative_to(Path.cwd())}")
+            if not sub_folders:
+                leaf_paths.append(os.path.join(base_dir, folder_name))
+            else:
+                leaf_paths.extend(os.path.join(base_dir, folder_name, sub_folder) for sub_folder in sub_folders)
+        
+        # Leaves are independent; threads only pay off on high-latency filesystems
+        if parallel and len(leaf_paths) > 1:
+            with ThreadPoolExecutor(max_workers=_MKDIR_WORKERS) as executor:
+                list(executor.map(_make_dir, leaf_paths))
+        else:
+            for leaf_path in leaf_paths:
+                _make_dir(leaf_path)
+    
+    def _write_tree(self, lines: List[str]) -> None:
+        """
+        Write tree lines framed by the success banner
+        
+        Args:
+            lines (List[str]): Rendered tree lines, project root first
+        """
+        sys.stdout.write(_HEADER + "\n".join(lines) + _FOOTER)
     
-    def _print_directory_tree(self, path: Path, prefix: str = "", is_last: bool = True) -> None:
+    def _render_dict_tree(self, node: Dict[str, dict], lines: List[str], prefix: str = "") -> None:
         """
-        Print directory tree structure
+        Collect tree lines for a nested folder dictionary
         
         Args:
-            path (Path): Directory path
+            node (Dict): Folder name -> child folder dictionary
+            lines (List[str]): Output lines, appended in place
             prefix (str): Prefix for tree display
-            is_last (bool): Whether this is the last item at current level
         """
-        if path.is_dir():
-            # Print current directory
-            connector = "└── " if is_last else "├── "
-            print(f"{prefix}{connector}{path.name}/")
-            
-            # Get subdirectories and files
-            items = sorted([item for item in path.iterdir()])
-            dirs = [item for item in items if item.is_dir()]
-            files = [item for item in items if item.is_file()]
-            
-            # Print subdirectories first
-            for i, subdir in enumerate(dirs):
-                is_last_dir = (i == len(dirs) - 1) and len(files) == 0
-                new_prefix = prefix + ("    " if is_last else "│   ")
-                self._print_directory_tree(subdir, new_prefix, is_last_dir)
-            
-            # Print files
-            for i, file in enumerate(files):
-                is_last_file = (i == len(files) - 1)
-                connector = "└── " if is_last_file else "├── "
-                new_prefix = prefix + ("    " if is_last else "│   ")
-                print(f"{new_prefix}{connector}{file.name}")
+        last = len(node) - 1
+        for i, (name, children) in enumerate(node.items()):
+            is_last = i == last
+            lines.append(f"{prefix}{_LAST_CONNECTOR if is_last else _MID_CONNECTOR}{name}/")
+            if children:
+                self._render_dict_tree(children, lines, prefix + ("    " if is_last else "│   "))
     
-    def print_project_structure(self, project_root: Path) -> None:
+    def _print_structure_from_dict(self, root_name: str, structure: Mapping[str, Sequence[str]]) -> None:
         """
-        Print the entire project structure
+        Print project structure from the in-memory configuration, without touching the filesystem
         
         Args:
-            project_root (Path): Project root directory path
+            root_name (str): Project root folder name
+            structure (Mapping): Directory structure, folder name -> subfolder names
         """
+        # Mirror what mkdir creates: path separators nest folders, repeated names merge
+        tree: Dict[str, dict] = {}
+        for folder_name, sub_folders in structure.items():
+            paths = [os.path.join(folder_name, sub_folder) for sub_folder in sub_folders] or [folder_name]
+            for path in paths:
+                node = tree
+                for part in os.path.normpath(path).split(os.sep):
+                    node = node.setdefault(part, {})
         
-        print(f"\n✅️ Created ML project successfully")
-        print(f"\n📁 Project Structure:")
-        print("=" * 50)
-        print(f"{project_root.name}/")
+        lines: List[str] = [f"{root_name}/"]
+        self._render_dict_tree(tree, lines)
+        self._write_tree(lines)
+    
+    def print_project_structure(self, project_root: Union[str, Path]) -> None:
+        """
+        Print the entire project structure as found on disk
         
-        # Get all items in project root
-        items = sorted([item for item in project_root.iterdir()])
+        Args:
+            project_root (Union[str, Path]): Project root directory path
+            
+        Raises:
+            OSError: When a directory in the tree cannot be listed
+        """
+        # Normalise so a trailing separator does not blank the root name
+        project_root = os.path.normpath(os.fspath(project_root))
+        
+        # List every directory in one scandir-backed walk
+        listing: Dict[str, Tuple[List[str], List[str]]] = {}
+        for dirpath, dirnames, filenames in os.walk(project_root, onerror=_raise_error):
+            dirnames.sort()
+            filenames.sort()
+            listing[dirpath] = (dirnames, filenames)
         
-        for i, item in enumerate(items):
-            is_last = (i == len(items) - 1)
-            self._print_directory_tree(item, "", is_last)
+        # Render depth-first with an explicit stack: (parent path, prefix, name, is_dir, is_last)
+        lines: List[str] = [f"{os.path.basename(project_root)}/"]
+        stack: List[Tuple[str, str, str, bool, bool]] = []
         
-        print("=" * 50)
+        def push_children(dirpath: str, prefix: str) -> None:
+            dirnames, filenames = listing.get(dirpath, ((), ()))
+            children = [(name, True) for name in dirnames] + [(name, False) for name in filenames]
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                name, is_dir = children[i]
+                stack.append((dirpath, prefix, name, is_dir, i == last))
+        
+        push_children(project_root, "")
+        while stack:
+            parent, prefix, name, is_dir, is_last = stack.pop()
+            connector = _LAST_CONNECTOR if is_last else _MID_CONNECTOR
+            if is_dir:
+                lines.append(f"{prefix}{connector}{name}/")
+                push_children(os.path.join(parent, name), prefix + ("    " if is_last else "│   "))
+            else:
+                lines.append(f"{prefix}{connector}{name}")
+        
+        self._write_tree(lines)
     
-    def create_project(self, project_name: str) -> Path:
+    def create_project(self, project_name: str, verify: bool = False, parallel: bool = False) -> Path:
         """
         Create machine learning project structure
         
         Args:
             project_name (str): Project name
+            verify (bool): Print the structure by walking the created directories
+                instead of from the configuration
+            parallel (bool): Create custom structures on a thread pool, useful on
+                network filesystems (NFS, SMB, GPFS); slower on local disks
             
         Returns:
             Path: Created project root directory path
@@ -124,25 +240,33 @@ class MLProjectCreator:
             raise ValueError("Project name cannot be empty")
         
         # Generate project folder name with timestamp
-        timestamp: str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp: str = time.strftime("%Y%m%d_%H%M%S")
         full_project_name: str = f"{project_name}_{timestamp}"
         
         # Create project root directory
-        project_root: Path = Path.cwd() / full_project_name
+        cwd: str = os.getcwd()
+        project_root: str = os.path.join(cwd, full_project_name)
         
         try:
-            project_root.mkdir(exist_ok=True)
-            # print(f"Created main project folder: {project_root}")
+            _make_dir(project_root)
+            # print(f"Created main project folder: {os.path.relpath(project_root, cwd)}")
             
-            # Create directory structure
-            self._create_directory_recursive(project_root, self.structure)
+            # Create directory structure (default layout uses the precomputed paths)
+            if self._structure is _DEFAULT_STRUCTURE:
+                for default_dir in _DEFAULT_DIRS:
+                    _make_dir(os.path.join(project_root, default_dir))
+            else:
+                self._create_directory_recursive(project_root, self._structure, parallel)
             
-            # print(f"Project creation completed: {project_root}")
+            # print(f"Project creation completed: {os.path.relpath(project_root, cwd)}")
             
             # Print project structure
-            self.print_project_structure(project_root)
+            if verify:
+                self.print_project_structure(project_root)
+            else:
+                self._print_structure_from_dict(full_project_name, self._structure)
             
-            return project_root
+            return Path(project_root)
             
         except OSError as e:
             print(f"Error occurred while creating project: {e}")
@@ -163,10 +287,10 @@ def parse_folders_with_colon(folder_specs: List[str]) -> Dict[str, List[str]]:
     result = {}
     
     for spec in folder_specs:
-        if ':' in spec:
-            folder_name, sub_spec = spec.split(':', 1)
-            sub_folders = [s.strip() for s in sub_spec.split(',') if s.strip()]
-            result[folder_name] = sub_folders
+        folder_name, sep, sub_spec = spec.partition(':')
+        if sep:
+            # Strip each comma-separated subfolder once, skipping empty entries
+            result[folder_name] = [s for s in map(str.strip, sub_spec.split(',')) if s]
         else:
             # Simple folder
             result[spec] = []
@@ -207,6 +331,18 @@ Examples:
         Folder with subdirectories: "folder_name:sub1,sub2,sub3"'''
     )
     
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Print the structure read back from disk instead of from the configuration'
+    )
+    
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Create directories concurrently (for network filesystems; slower on local disks)'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -218,7 +354,7 @@ Examples:
             # Use default structure
             creator = MLProjectCreator()
         
-        creator.create_project(args.project_name)
+        creator.create_project(args.project_name, verify=args.verify, parallel=args.parallel)
         
     except ValueError as e:
         print(f"Input error: {e}")